@@ -3,15 +3,15 @@ from __future__ import annotations
 import re
 from typing import Optional
 
-WHITESPACE_RE = re.compile(r"\s+")
+RATING_RE = re.compile(r"\d+(?:\.\d+)?")
 
 def clean_text(text: str | None) -> str:
     """
     Normalize whitespace and strip leading/trailing spaces from text.
     """
-    if text is None:
+    if not text:
         return ""
-    return WHITESPACE_RE.sub(" ", text).strip()
+    return " ".join(text.split())
 
 def extract_rating_from_aria(aria_label: str | None) -> Optional[float]:
     """
@@ -20,11 +20,20 @@ def extract_rating_from_aria(aria_label: str | None) -> Optional[float]:
     if not aria_label:
         return None
 
-    match = re.search(r"(\d+(\.\d+)?)", aria_label)
+    # Fast path: Yelp labels are shaped like "<rating> star rating"
+    head = aria_label.split(" ", 1)[0]
+    # Only plain decimals, so the result always agrees with RATING_RE below
+    if head[:1].isdigit() and head.replace(".", "", 1).isdigit():
+        try:
+            return float(head)
+        except ValueError:
+            pass
+
+    match = RATING_RE.search(aria_label)
     if not match:
         return None
 
     try:
-        return float(match.group(1))
+        return float(match.group(0))
     except ValueError:
         return None
\ No newline at end of file
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from .text_utils import clean_text, extract_rating_from_aria
 
+# (555) 555-1234 or 555-555-1234
+_PHONE_RE = re.compile(r"\(\d{3}\)\s*\d{3}-\d{4}|\d{3}-\d{3}-\d{4}")
+
+# Matches e.g. aria-label="4.5 star rating", case-insensitively
+_STAR_RATING_SELECTOR = '[aria-label*="star rating" i]'
+
 @dataclass
 class Review:
     author: Optional[str]
@@ -24,61 +30,93 @@ class Business:
     url: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built by hand: all fields are flat, so `asdict`'s recursive copy is not needed
+        return {
+            "businessName": self.businessName,
+            "address": self.address,
+            "phoneNumber": self.phoneNumber,
+            "rating": self.rating,
+            "reviewText": self.reviewText,
+            "url": self.url,
+        }
+
+def _node_text(node: LexborNode) -> str:
+    return clean_text(node.text(deep=True, separator=" ", strip=True))
 
-def _extract_business_cards(soup: BeautifulSoup, base_url: str, max_results: int) -> List[Dict[str, Any]]:
+def _extract_business_cards(tree: LexborHTMLParser, base_url: str, max_results: int) -> List[Dict[str, Any]]:
     """
     Extract basic business info from a Yelp search results page.
 
     This function aims to be resilient by using generic selectors instead of fragile class names.
     """
-    seen_urls: set[str] = set()
-    results: List[Dict[str, Any]] = []
+    if max_results <= 0:
+        return []
+
+    base = base_url.rstrip("/")
+    # url -> [name, rating]; dict order is the order each business is first linked
+    cards: Dict[str, List[Any]] = {}
+    named = 0
+    current_url: Optional[str] = None
+    leading_rating: Optional[float] = None
 
     # Strategy:
     # - Find links that look like /biz/<slug>
     # - Derive name from link text
-    # - Look nearby for rating container (aria-label with "star rating")
-    for link in soup.select("a[href^='/biz/']"):
-        href = link.get("href")
-        if not href:
+    # - Find the rating (aria-label with "star rating") that belongs to each business
+    #
+    # A single query returns result links and rating nodes together in document
+    # order. Yelp repeats the same /biz/ link several times per card (image, title,
+    # ...), so the first link to a new business starts its card, and the first
+    # rating that parses before the next business starts belongs to it. A rating
+    # that precedes every result link goes to the first business if it has none.
+    # selectolax has no lazy CSS iterator; the matched list is built in C and is
+    # cheaper than a Python-level `traverse()`, so we only stop the loop early.
+    for node in tree.css(f"a[href^='/biz/'], {_STAR_RATING_SELECTOR}"):
+        href = node.attributes.get("href") if node.tag == "a" else None
+        if href and href.startswith("/biz/"):
+            # Strip query params
+            full_url = base + href.partition("?")[0]
+
+            card = cards.get(full_url)
+            if card is None:
+                if named >= max_results:
+                    break
+                card = cards[full_url] = [None, None]
+                current_url = full_url
+
+            if card[0] is None:
+                name = _node_text(node)
+                if name:
+                    card[0] = name
+                    named += 1
             continue
 
-        # Strip query params
-        href = href.split("?", 1)[0]
-        full_url = base_url.rstrip("/") + href
-
-        if full_url in seen_urls:
+        rating_value = extract_rating_from_aria(node.attributes.get("aria-label"))
+        if rating_value is None:
             continue
+        if current_url is None:
+            if leading_rating is None:
+                leading_rating = rating_value
+        elif cards[current_url][1] is None:
+            cards[current_url][1] = rating_value
 
-        name = clean_text(link.get_text(" ", strip=True))
+    results: List[Dict[str, Any]] = []
+    for full_url, (name, rating_value) in cards.items():
         if not name:
             continue
-
-        # Try to find rating near the link
-        rating_value: Optional[float] = None
-        current = link
-        for _ in range(4):  # limited hops to keep it cheap
-            current = current.parent
-            if current is None:
-                break
-            rating_node = current.find(attrs={"aria-label": re.compile(r"star rating", re.I)})
-            if rating_node and rating_node.has_attr("aria-label"):
-                rating_value = extract_rating_from_aria(rating_node["aria-label"])
-                if rating_value is not None:
-                    break
-
-        result = {
-            "businessName": name,
-            "address": None,
-            "phoneNumber": None,
-            "rating": rating_value,
-            "reviewText": None,
-            "url": full_url,
-        }
-        seen_urls.add(full_url)
-        results.append(result)
-
+        if rating_value is None and not results:
+            rating_value = leading_rating
+
+        results.append(
+            {
+                "businessName": name,
+                "address": None,
+                "phoneNumber": None,
+                "rating": rating_value,
+                "reviewText": None,
+                "url": full_url,
+            }
+        )
         if len(results) >= max_results:
             break
 
@@ -90,79 +128,99 @@ def parse_search_results(html: str, base_url: str = "https://www.yelp.com", max_
 
     The output is aligned with the README's example structure.
     """
-    soup = BeautifulSoup(html, "lxml")
-    businesses = _extract_business_cards(soup, base_url=base_url, max_results=max_results)
+    tree = LexborHTMLParser(html)
+    businesses = _extract_business_cards(tree, base_url=base_url, max_results=max_results)
     return businesses
 
-def _extract_address(soup: BeautifulSoup) -> Optional[str]:
+def _extract_address(tree: LexborHTMLParser) -> Optional[str]:
     # Try several strategies to find address text on a business page
     # 1. Look for schema.org postal address
-    address_candidate = soup.find(attrs={"data-testid": re.compile("address", re.I)})
-    if address_candidate:
-        return clean_text(address_candidate.get_text(" ", strip=True))
+    address_candidate = tree.css_first('[data-testid*="address" i]')
+    if address_candidate is not None:
+        return _node_text(address_candidate)
 
     # 2. Look for elements with "address" in aria-label or title
-    for elem in soup.find_all(True, attrs={"aria-label": re.compile("address", re.I)}):
-        text = clean_text(elem.get_text(" ", strip=True))
+    for elem in tree.css('[aria-label*="address" i]'):
+        text = _node_text(elem)
         if text:
             return text
 
     # 3. Fallback: any `<address>` tag
-    addr_tag = soup.find("address")
-    if addr_tag:
-        return clean_text(addr_tag.get_text(" ", strip=True))
+    addr_tag = tree.css_first("address")
+    if addr_tag is not None:
+        return _node_text(addr_tag)
 
     return None
 
-def _extract_phone(soup: BeautifulSoup) -> Optional[str]:
+def _phone_from_tel_href(href: Optional[str]) -> Optional[str]:
+    # "tel:+14155551234" -> "(415) 555-1234"
+    if not href:
+        return None
+    digits = "".join(ch for ch in href[len("tel:"):] if ch.isdigit())
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    if len(digits) != 10:
+        return None
+    return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+
+def _extract_phone(tree: LexborHTMLParser) -> Optional[str]:
     # Yelp often shows phone numbers in buttons or plain text.
-    # We'll search for a pattern resembling a phone number.
-    text = soup.get_text(" ", strip=True)
-    patterns = [
-        r"\(\d{3}\)\s*\d{3}-\d{4}",  # (555) 555-1234
-        r"\d{3}-\d{3}-\d{4}",        # 555-555-1234
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    # Check the most likely nodes first so we rarely need the whole document text.
+    for link in tree.css('a[href^="tel:"]'):
+        match = _PHONE_RE.search(link.text(deep=True, separator=" ", strip=True))
         if match:
             return match.group(0)
-    return None
-
-def _extract_overall_rating(soup: BeautifulSoup) -> Optional[float]:
+        phone = _phone_from_tel_href(link.attributes.get("href"))
+        if phone:
+            return phone
+
+    # Then dedicated phone widgets, then the sidebar where Yelp lists contact details
+    for selector in ('[data-testid*="phone" i]', "aside"):
+        for node in tree.css(selector):
+            match = _PHONE_RE.search(node.text(deep=True, separator=" ", strip=True))
+            if match:
+                return match.group(0)
+
+    # Fallback: search for a pattern resembling a phone number anywhere on the page.
+    text = tree.text(separator=" ", strip=True)
+    match = _PHONE_RE.search(text)
+    return match.group(0) if match else None
+
+def _extract_overall_rating(tree: LexborHTMLParser) -> Optional[float]:
     # Look for a prominent element with aria-label containing "star rating"
-    rating_node = soup.find(attrs={"aria-label": re.compile(r"star rating", re.I)})
-    if rating_node and rating_node.has_attr("aria-label"):
-        return extract_rating_from_aria(rating_node["aria-label"])
+    rating_node = tree.css_first(_STAR_RATING_SELECTOR)
+    if rating_node is not None:
+        return extract_rating_from_aria(rating_node.attributes.get("aria-label"))
     return None
 
-def _extract_top_review(soup: BeautifulSoup) -> Optional[Review]:
+def _extract_top_review(tree: LexborHTMLParser) -> Optional[Review]:
     """
     Extract a single prominent review (if present) from the business page.
     """
     # Heuristic: look for elements that might represent review containers
     # with a rating and some text.
-    review_blocks = soup.find_all(attrs={"itemprop": re.compile("review", re.I)})
+    review_blocks = tree.css('[itemprop*="review" i]')
     if not review_blocks:
         # Fallback: search by data-testid marker commonly used by Yelp
-        review_blocks = soup.find_all(attrs={"data-testid": re.compile("review", re.I)})
+        review_blocks = tree.css('[data-testid*="review" i]')
 
     for block in review_blocks:
         # Extract review text
-        text = clean_text(block.get_text(" ", strip=True))
+        text = _node_text(block)
         if not text:
             continue
 
         # Extract rating within the block if available
         rating_val: Optional[float] = None
-        rating_node = block.find(attrs={"aria-label": re.compile(r"star rating", re.I)})
-        if rating_node and rating_node.has_attr("aria-label"):
-            rating_val = extract_rating_from_aria(rating_node["aria-label"])
+        rating_node = block.css_first(_STAR_RATING_SELECTOR)
+        if rating_node is not None:
+            rating_val = extract_rating_from_aria(rating_node.attributes.get("aria-label"))
 
         # Extract author if available
         author = None
-        author_node = block.find(attrs={"itemprop": re.compile("author", re.I)})
-        if author_node:
-            author = clean_text(author_node.get_text(" ", strip=True))
+        author_node = block.css_first('[itemprop*="author" i]')
+        if author_node is not None:
+            author = _node_text(author_node)
 
         return Review(author=author, rating=rating_val, text=text)
 
@@ -172,24 +230,24 @@ def parse_business_page(html: str, url: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse a Yelp business detail page into a Business dictionary.
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = LexborHTMLParser(html)
 
     # Business name
     name = None
     # 1. Look for schema.org name
-    name_node = soup.find(attrs={"itemprop": re.compile("name", re.I)})
-    if name_node:
-        name = clean_text(name_node.get_text(" ", strip=True))
+    name_node = tree.css_first('[itemprop*="name" i]')
+    if name_node is not None:
+        name = _node_text(name_node)
     if not name:
         # 2. Fallback: first <h1>
-        h1 = soup.find("h1")
-        if h1:
-            name = clean_text(h1.get_text(" ", strip=True))
-
-    address = _extract_address(soup)
-    phone = _extract_phone(soup)
-    rating = _extract_overall_rating(soup)
-    top_review = _extract_top_review(soup)
+        h1 = tree.css_first("h1")
+        if h1 is not None:
+            name = _node_text(h1)
+
+    address = _extract_address(tree)
+    phone = _extract_phone(tree)
+    rating = _extract_overall_rating(tree)
+    top_review = _extract_top_review(tree)
 
     business = Business(
         businessName=name,
@@ -5,40 +5,82 @@ import logging
 from pathlib import Path
 from typing import Any, Iterable, List, Mapping
 
+import orjson
+
 logger = logging.getLogger("yelp_scraper.exporters")
 
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 def _ensure_serializable(record: Any) -> Any:
     """
     Best-effort conversion of complex objects to JSON-serializable structures.
+
+    Used as the orjson `default` hook for values orjson cannot serialize natively.
+    Only the outermost value is converted; orjson walks the returned container
+    itself and calls back here for any nested values it still cannot handle.
+    Keep in step with `_to_plain`, the recursive twin used by the stdlib `json`
+    fallback; they can't merge because orjson must not have its containers pre-walked.
+    """
+    if isinstance(record, float):
+        # orjson does not serialize float subclasses natively
+        return float(record)
+
+    if isinstance(record, Mapping):
+        return dict(record)
+
+    if isinstance(record, (list, tuple, set, frozenset)):
+        return list(record)
+
+    # Fallback: string representation
+    return str(record)
+
+def _to_plain(record: Any) -> Any:
+    """
+    Recursively convert a value to plain JSON types, stringifying every mapping key.
+
+    Slow path for records orjson rejects even with `_ensure_serializable`
+    (e.g. tuple keys, ints wider than 64 bits); the result goes to the stdlib encoder.
+    Keep in step with `_ensure_serializable`, the shallow orjson `default` hook; they
+    can't merge because the stdlib encoder needs the whole tree converted up front.
     """
     if isinstance(record, (str, int, float, bool)) or record is None:
         return record
 
     if isinstance(record, Mapping):
-        return {str(k): _ensure_serializable(v) for k, v in record.items()}
+        return {str(k): _to_plain(v) for k, v in record.items()}
 
-    if isinstance(record, (list, tuple, set)):
-        return [_ensure_serializable(item) for item in record]
+    if isinstance(record, (list, tuple, set, frozenset)):
+        return [_to_plain(item) for item in record]
 
     # Fallback: string representation
     return str(record)
 
+def _dumps_line(record: Mapping[str, Any]) -> bytes:
+    try:
+        return orjson.dumps(record, default=_ensure_serializable, option=JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+    except orjson.JSONEncodeError:
+        return (json.dumps(_to_plain(record), ensure_ascii=False) + "\n").encode("utf-8")
+
 def export_to_json(records: Iterable[Mapping[str, Any]], output_path: Path) -> None:
     """
     Export a sequence of mapping-like objects to a single JSON array.
     """
-    normalized: List[Any] = [_ensure_serializable(r) for r in records]
-    logger.info("Writing %d records to %s", len(normalized), output_path)
+    items: List[Mapping[str, Any]] = records if isinstance(records, list) else list(records)
+    logger.info("Writing %d records to %s", len(items), output_path)
+
+    try:
+        payload = orjson.dumps(items, default=_ensure_serializable, option=JSON_OPTIONS | orjson.OPT_INDENT_2)
+    except orjson.JSONEncodeError as exc:
+        logger.debug("orjson could not encode records (%s); falling back to json", exc)
+        payload = json.dumps(_to_plain(items), indent=2, ensure_ascii=False).encode("utf-8")
 
-    with output_path.open("w", encoding="utf-8") as fh:
-        json.dump(normalized, fh, indent=2, ensure_ascii=False)
+    with output_path.open("wb") as fh:
+        fh.write(payload)
 
 def export_to_jsonl(records: Iterable[Mapping[str, Any]], output_path: Path) -> None:
     """
     Export a sequence of mapping-like objects to JSON Lines format.
     """
     logger.info("Writing JSONL records to %s", output_path)
-    with output_path.open("w", encoding="utf-8") as fh:
-        for record in records:
-            line = json.dumps(_ensure_serializable(record), ensure_ascii=False)
-            fh.write(line + "\n")
\ No newline at end of file
+    with output_path.open("wb") as fh:
+        fh.writelines(_dumps_line(record) for record in records)
\ No newline at end of file
@@ -1,11 +1,15 @@
 import argparse
+import functools
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
+from urllib.parse import urlencode, urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Ensure the `src` folder (where this file lives) is on sys.path so we can import sibling packages
 CURRENT_FILE = Path(__file__).resolve()
@@ -20,12 +24,61 @@ from outputs.exporters import export_to_json  # type: ignore  # noqa: E402
 
 logger = logging.getLogger("yelp_scraper")
 
+def build_session(
+    pool_size: int = 32,
+    cache_name: str | None = None,
+    cache_expire_seconds: int = 3600,
+) -> requests.Session:
+    """
+    Create a pooled HTTP session so repeated requests to Yelp reuse connections.
+
+    When `cache_name` is given and `requests_cache` is installed, responses are also
+    cached on disk in a SQLite database of that name, keyed by URL.
+    """
+    session: requests.Session
+    if cache_name:
+        try:
+            import requests_cache
+        except ImportError:
+            logger.warning("requests_cache is not installed; HTTP responses will not be cached")
+            session = requests.Session()
+        else:
+            session = requests_cache.CachedSession(
+                cache_name=cache_name,
+                backend="sqlite",
+                expire_after=cache_expire_seconds,
+            )
+    else:
+        session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+HTTP_SESSION = build_session()
+
+@functools.lru_cache(maxsize=None)
+def get_cached_session(cache_name: str, cache_expire_seconds: int) -> requests.Session:
+    """
+    Return the caching session for a cache configuration, building it on first use.
+
+    Like `HTTP_SESSION`, the session lives for the whole process, so repeated
+    `run_scraper` calls share one session and one SQLite connection.
+    """
+    return build_session(cache_name=cache_name, cache_expire_seconds=cache_expire_seconds)
+
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Dict[str, Any]:
     """
     Load scraper settings from the example settings file.
 
     In a real deployment, users can copy this file to `settings.json` and adjust values.
     For this demo implementation, we just use `settings.example.json` directly.
+
+    The parsed settings are cached for the life of the process and shared between
+    callers, so treat the returned dict as read-only. Call `invalidate_settings_cache()`
+    after editing the file to pick up the changes.
     """
     config_path = SRC_DIR / "config" / "settings.example.json"
     if not config_path.exists():
@@ -35,6 +88,12 @@ def load_settings() -> Dict[str, Any]:
     with config_path.open("r", encoding="utf-8") as fh:
         return json.load(fh)
 
+def invalidate_settings_cache() -> None:
+    """
+    Drop the cached settings so the next `load_settings()` call re-reads the file.
+    """
+    load_settings.cache_clear()
+
 def load_inputs(inputs_path: Path) -> List[str]:
     """
     Load search queries or Yelp URLs from a text file.
@@ -44,34 +103,39 @@ def load_inputs(inputs_path: Path) -> List[str]:
     if not inputs_path.exists():
         raise FileNotFoundError(f"Input file not found: {inputs_path}")
 
-    queries: List[str] = []
-    with inputs_path.open("r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            queries.append(line)
+    raw = inputs_path.read_text(encoding="utf-8")
+    stripped = (line.strip() for line in raw.splitlines())
+    queries: List[str] = [line for line in stripped if line and not line.startswith("#")]
 
     logger.info("Loaded %d input entries from %s", len(queries), inputs_path)
     return queries
 
-def build_search_url(base_url: str, search_path: str, query: str, location: str | None = None) -> str:
-    from urllib.parse import urlencode, urljoin
-
+def build_search_url(search_base_url: str, query: str, location: str | None = None) -> str:
+    """
+    Build a search URL from a pre-joined base (e.g. `https://www.yelp.com/search`).
+    """
     params: Dict[str, str] = {"find_desc": query}
     if location:
         params["find_loc"] = location
 
-    query_string = urlencode(params)
-    return urljoin(base_url, search_path) + f"?{query_string}"
+    return f"{search_base_url}?{urlencode(params)}"
 
-def fetch_html(url: str, headers: Dict[str, str], timeout: int) -> str | None:
+def fetch_html(
+    url: str,
+    headers: Dict[str, str],
+    timeout: int,
+    session: requests.Session | None = None,
+) -> str | None:
     """
     Fetch HTML content from a URL with basic error handling.
+
+    When a `session` is given, its pooled connections are reused for the request.
     """
+    client = session if session is not None else requests
     try:
-        logger.debug("Fetching URL: %s", url)
-        response = requests.get(url, headers=headers, timeout=timeout)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching URL: %s", url)
+        response = client.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response.text
     except requests.RequestException as exc:
@@ -84,29 +148,35 @@ def enrich_businesses_with_details(
     headers: Dict[str, str],
     timeout: int,
     max_detail_requests: int,
+    session: requests.Session | None = None,
+    max_workers: int = 8,
 ) -> List[Dict[str, Any]]:
     """
     For each business that has a `url`, fetch the business page and merge detailed data.
     To avoid hammering Yelp, we limit the number of detail requests per run.
+
+    Detail pages are fetched concurrently on up to `max_workers` threads; the
+    order of `businesses` is preserved in the result.
     """
-    enriched: List[Dict[str, Any]] = []
-    detail_count = 0
+    enriched: List[Dict[str, Any]] = list(businesses)
+    targets = [i for i, biz in enumerate(businesses) if biz.get("url")][: max(0, max_detail_requests)]
+    if not targets:
+        logger.info("Fetched detailed pages for 0 businesses")
+        return enriched
 
-    for biz in businesses:
-        url = biz.get("url")
-        if not url or detail_count >= max_detail_requests:
-            enriched.append(biz)
-            continue
+    def fetch(index: int) -> str | None:
+        return fetch_html(businesses[index]["url"], headers=headers, timeout=timeout, session=session)
 
-        html = fetch_html(url, headers=headers, timeout=timeout)
-        if not html:
-            enriched.append(biz)
-            continue
+    detail_count = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+        for index, html in zip(targets, executor.map(fetch, targets)):
+            if not html:
+                continue
 
-        details = parse_business_page(html, url=url)
-        merged = {**biz, **details}
-        enriched.append(merged)
-        detail_count += 1
+            biz = businesses[index]
+            details = parse_business_page(html, url=biz["url"])
+            enriched[index] = {**biz, **details}
+            detail_count += 1
 
     logger.info("Fetched detailed pages for %d businesses", detail_count)
     return enriched
@@ -130,9 +200,18 @@ def run_scraper(
 
     base_url: str = settings.get("base_url", "https://www.yelp.com")
     search_path: str = settings.get("search_path", "/search")
+    search_base_url = urljoin(base_url, search_path)
     timeout_seconds: int = int(settings.get("timeout_seconds", 10))
     max_results_per_query: int = int(settings.get("max_results_per_query", 50))
     max_detail_requests_per_query: int = int(settings.get("max_detail_requests_per_query", 10))
+    detail_workers: int = int(settings.get("detail_workers", 8))
+
+    session = HTTP_SESSION
+    if settings.get("cache_enabled", False):
+        session = get_cached_session(
+            settings.get("cache_name", ".yelp_http_cache"),
+            int(settings.get("cache_expire_seconds", 3600)),
+        )
 
     headers = {
         "User-Agent": settings.get(
@@ -153,15 +232,15 @@ def run_scraper(
 
         if raw.startswith("http://") or raw.startswith("https://"):
             # Treat as a direct Yelp business URL
-            html = fetch_html(raw, headers=headers, timeout=timeout_seconds)
+            html = fetch_html(raw, headers=headers, timeout=timeout_seconds, session=session)
             if not html:
                 continue
             biz = parse_business_page(html, url=raw)
             all_results.append(biz)
         else:
             # Treat as a search query
-            search_url = build_search_url(base_url, search_path, raw, location=location)
-            html = fetch_html(search_url, headers=headers, timeout=timeout_seconds)
+            search_url = build_search_url(search_base_url, raw, location=location)
+            html = fetch_html(search_url, headers=headers, timeout=timeout_seconds, session=session)
             if not html:
                 continue
 
@@ -176,6 +255,8 @@ def run_scraper(
                 headers=headers,
                 timeout=timeout_seconds,
                 max_detail_requests=max_detail_requests_per_query,
+                session=session,
+                max_workers=detail_workers,
             )
             all_results.extend(businesses)
 
@@ -0,0 +1,29 @@
+import json
+
+from outputs.exporters import export_to_json, export_to_jsonl
+
+RECORDS = [
+    {"businessName": "Café", "rating": 4.5, "tags": {"pizza"}},
+    {"businessName": "Odd", "extra": {("a", 1): "tuple key"}, "big": 2**70},
+]
+
+def test_export_to_json_falls_back_for_values_orjson_rejects(tmp_path):
+    output = tmp_path / "out.json"
+
+    export_to_json(RECORDS, output)
+
+    assert json.loads(output.read_text(encoding="utf-8")) == [
+        {"businessName": "Café", "rating": 4.5, "tags": ["pizza"]},
+        {"businessName": "Odd", "extra": {"('a', 1)": "tuple key"}, "big": 2**70},
+    ]
+
+def test_export_to_jsonl_falls_back_per_record(tmp_path):
+    output = tmp_path / "out.jsonl"
+
+    export_to_jsonl(iter(RECORDS), output)
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"businessName": "Café", "rating": 4.5, "tags": ["pizza"]},
+        {"businessName": "Odd", "extra": {"('a', 1)": "tuple key"}, "big": 2**70},
+    ]
@@ -0,0 +1,75 @@
+import random
+import threading
+import time
+
+import runner
+
+def _stub_fetch(fetched):
+    lock = threading.Lock()
+
+    def fetch_html(url, headers, timeout, session=None):
+        time.sleep(random.uniform(0, 0.02))
+        with lock:
+            fetched.append(url)
+        return f"<html><body><h1>Detail {url}</h1></body></html>"
+
+    return fetch_html
+
+def _businesses():
+    return [
+        {"businessName": "A", "url": "https://www.yelp.com/biz/a"},
+        {"businessName": "No URL 1"},
+        {"businessName": "B", "url": "https://www.yelp.com/biz/b"},
+        {"businessName": "C", "url": "https://www.yelp.com/biz/c"},
+        {"businessName": "No URL 2", "url": None},
+        {"businessName": "D", "url": "https://www.yelp.com/biz/d"},
+        {"businessName": "E", "url": "https://www.yelp.com/biz/e"},
+    ]
+
+def test_enrich_fetches_first_n_urls_concurrently_and_keeps_order(monkeypatch):
+    fetched = []
+    monkeypatch.setattr(runner, "fetch_html", _stub_fetch(fetched))
+    businesses = _businesses()
+
+    enriched = runner.enrich_businesses_with_details(
+        base_url="https://www.yelp.com",
+        businesses=businesses,
+        headers={},
+        timeout=1,
+        max_detail_requests=3,
+        max_workers=4,
+    )
+
+    assert sorted(fetched) == [
+        "https://www.yelp.com/biz/a",
+        "https://www.yelp.com/biz/b",
+        "https://www.yelp.com/biz/c",
+    ]
+    assert [biz["businessName"] for biz in enriched] == [
+        "Detail https://www.yelp.com/biz/a",
+        "No URL 1",
+        "Detail https://www.yelp.com/biz/b",
+        "Detail https://www.yelp.com/biz/c",
+        "No URL 2",
+        "D",
+        "E",
+    ]
+    assert enriched[1] is businesses[1]
+    assert enriched[4] is businesses[4]
+    assert enriched[5] is businesses[5]
+
+def test_enrich_with_negative_cap_fetches_nothing(monkeypatch):
+    fetched = []
+    monkeypatch.setattr(runner, "fetch_html", _stub_fetch(fetched))
+    businesses = _businesses()
+
+    enriched = runner.enrich_businesses_with_details(
+        base_url="https://www.yelp.com",
+        businesses=businesses,
+        headers={},
+        timeout=1,
+        max_detail_requests=-1,
+    )
+
+    assert fetched == []
+    assert enriched == businesses
@@ -0,0 +1,20 @@
+import pytest
+
+from extractors.text_utils import extract_rating_from_aria
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("4.5 star rating", 4.5),
+        ("5 star rating", 5.0),
+        ("Rated 3 star rating", 3.0),
+        ("4_5 star rating", 4.0),
+        ("1e3 star rating", 1.0),
+        (".5 star rating", 5.0),
+        ("nan star rating", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_extract_rating_from_aria_matches_regex_semantics(label, expected):
+    assert extract_rating_from_aria(label) == expected
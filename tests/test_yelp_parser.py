@@ -0,0 +1,70 @@
+from extractors.yelp_parser import parse_search_results
+
+def _div_card(slug: str, name: str, rating: str) -> str:
+    return (
+        '<div class="card"><div class="media"><a href="/biz/{slug}"><img></a></div>'
+        '<div class="body"><h3><a href="/biz/{slug}?osq=x">{name}</a></h3>'
+        '<span aria-label="{rating} star rating"></span></div></div>'
+    ).format(slug=slug, name=name, rating=rating)
+
+def test_sibling_div_cards_keep_their_own_ratings():
+    html = (
+        "<html><body><main><section><div class=\"results\">"
+        + _div_card("alpha", "Alpha", "4.5")
+        + _div_card("beta", "Beta", "3.0")
+        + _div_card("gamma", "Gamma", "2.0")
+        + "</div></section></main></body></html>"
+    )
+
+    results = parse_search_results(html)
+
+    assert [(r["businessName"], r["rating"]) for r in results] == [
+        ("Alpha", 4.5),
+        ("Beta", 3.0),
+        ("Gamma", 2.0),
+    ]
+
+def test_unparseable_rating_falls_back_to_rating_before_first_result():
+    html = (
+        "<html><body><div>"
+        '<span aria-label="4.0 star rating"></span>'
+        '<div><h3><a href="/biz/alpha">Alpha</a><span aria-label="no star rating"></span></h3></div>'
+        "</div></body></html>"
+    )
+
+    results = parse_search_results(html)
+
+    assert results[0]["rating"] == 4.0
+
+def test_list_card_without_rating_does_not_borrow_neighbours():
+    html = (
+        "<html><body><ul>"
+        '<li><h3><a href="/biz/alpha">Alpha</a></h3><span aria-label="4.5 star rating"></span></li>'
+        '<li><h3><a href="/biz/beta">Beta</a></h3></li>'
+        "</ul></body></html>"
+    )
+
+    results = parse_search_results(html)
+
+    assert [r["rating"] for r in results] == [4.5, None]
+
+def test_link_inside_nested_li_uses_its_card_rating():
+    html = (
+        "<html><body>"
+        '<div class="card"><ul class="tags"><li><a href="/biz/alpha">Alpha</a></li></ul>'
+        '<span aria-label="4 star rating"></span></div>'
+        '<div class="card"><ul class="tags"><li><a href="/biz/beta">Beta</a></li></ul>'
+        '<span aria-label="2.5 star rating"></span></div>'
+        "</body></html>"
+    )
+
+    results = parse_search_results(html)
+
+    assert [(r["businessName"], r["rating"]) for r in results] == [("Alpha", 4.0), ("Beta", 2.5)]
+
+def test_max_results_keeps_rating_of_last_result():
+    html = "<html><body>" + _div_card("alpha", "Alpha", "4.5") + _div_card("beta", "Beta", "3.0") + "</body></html>"
+
+    results = parse_search_results(html, max_results=1)
+
+    assert [(r["businessName"], r["rating"]) for r in results] == [("Alpha", 4.5)]